@@ -7,8 +7,10 @@ from flask import Flask, send_from_directory
 from flask_cors import CORS
 from src.models.user import db
 from src.models.imovel import Imovel, FotoImovel, Contrato
+from src.models.arquivo import ImovelArquivado, FotoImovelArquivada, ContratoArquivado
 from src.routes.user import user_bp
 from src.routes.imoveis import imoveis_bp
+from src.routes.manutencao import manutencao_bp, agendar_manutencao
 
 app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
 app.config['SECRET_KEY'] = 'asdf#FGSgvasgf$5$WGT'
@@ -18,6 +20,7 @@ CORS(app)
 
 app.register_blueprint(user_bp, url_prefix='/api')
 app.register_blueprint(imoveis_bp, url_prefix='/api')
+app.register_blueprint(manutencao_bp, url_prefix='/api')
 
 # uncomment if you need to use database
 app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(os.path.dirname(__file__), 'database', 'app.db')}"
@@ -26,6 +29,13 @@ db.init_app(app)
 with app.app_context():
     db.create_all()
 
+# Arquivamento de registros inativos e manutenção do SQLite
+app.config['ARQUIVAMENTO_DIAS'] = int(os.environ.get('ARQUIVAMENTO_DIAS', 180))
+app.config['ARQUIVAMENTO_LOTE'] = int(os.environ.get('ARQUIVAMENTO_LOTE', 500))
+app.config['MANUTENCAO_INTERVALO_HORAS'] = float(os.environ.get('MANUTENCAO_INTERVALO_HORAS', 0))
+app.config['MANUTENCAO_LOCK'] = os.path.join(os.path.dirname(__file__), 'database', 'manutencao.lock')
+agendar_manutencao(app)
+
 @app.route('/', defaults={'path': ''})
 @app.route('/<path:path>')
 def serve(path):
@@ -0,0 +1,55 @@
+from src.models.user import db
+from src.models.imovel import Imovel, FotoImovel, Contrato
+from datetime import datetime
+
+def _copiar_colunas(tabela, chaves_estrangeiras=None):
+    """Replica as colunas de uma tabela ativa para a tabela de arquivo correspondente"""
+    chaves_estrangeiras = chaves_estrangeiras or {}
+    colunas = []
+    for coluna in tabela.columns:
+        args = [coluna.name, coluna.type.copy()]
+        if coluna.name in chaves_estrangeiras:
+            args.append(db.ForeignKey(chaves_estrangeiras[coluna.name]))
+        colunas.append(db.Column(
+            *args,
+            primary_key=coluna.primary_key,
+            nullable=coluna.nullable,
+            autoincrement=False
+        ))
+    colunas.append(db.Column('data_arquivamento', db.DateTime, nullable=False, default=datetime.utcnow))
+    return colunas
+
+class ImovelArquivado(db.Model):
+    __table__ = db.Table('imoveis_arquivados', db.metadata, *_copiar_colunas(Imovel.__table__))
+
+    fotos = db.relationship('FotoImovelArquivada', backref='imovel', lazy=True)
+
+    def __repr__(self):
+        return f'<ImovelArquivado {self.titulo}>'
+
+    def to_dict(self):
+        dados = Imovel.to_dict(self)
+        dados['arquivado'] = True
+        dados['data_arquivamento'] = self.data_arquivamento.isoformat() if self.data_arquivamento else None
+        return dados
+
+class FotoImovelArquivada(db.Model):
+    __table__ = db.Table('fotos_imoveis_arquivadas', db.metadata, *_copiar_colunas(
+        FotoImovel.__table__, {'imovel_id': 'imoveis_arquivados.id'}
+    ))
+
+    def to_dict(self):
+        return FotoImovel.to_dict(self)
+
+class ContratoArquivado(db.Model):
+    # imovel_id sem chave estrangeira: o imóvel pode continuar ativo ou já estar arquivado
+    __table__ = db.Table('contratos_arquivados', db.metadata, *_copiar_colunas(Contrato.__table__))
+
+    def __repr__(self):
+        return f'<ContratoArquivado {self.nome_cliente} - {self.tipo_contrato}>'
+
+    def to_dict(self):
+        dados = Contrato.to_dict(self)
+        dados['arquivado'] = True
+        dados['data_arquivamento'] = self.data_arquivamento.isoformat() if self.data_arquivamento else None
+        return dados
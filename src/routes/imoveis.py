@@ -1,10 +1,33 @@
 from flask import Blueprint, request, jsonify
 from src.models.imovel import db, Imovel, FotoImovel, Contrato, TipoImovel, StatusImovel
+from src.models.arquivo import ImovelArquivado, ContratoArquivado
 from datetime import datetime, date
 import json
 
 imoveis_bp = Blueprint('imoveis', __name__)
 
+def _filtrar_imoveis(query, modelo, tipo, status, cidade, valor_min, valor_max, quartos_min):
+    """Aplica os filtros de listagem ao modelo de imóvel ativo ou arquivado"""
+    if tipo:
+        query = query.filter(modelo.tipo == TipoImovel(tipo))
+    if status:
+        query = query.filter(modelo.status == StatusImovel(status))
+    if cidade:
+        query = query.filter(modelo.cidade.ilike(f'%{cidade}%'))
+    if valor_min:
+        query = query.filter(
+            (modelo.valor_venda >= valor_min) | 
+            (modelo.valor_aluguel >= valor_min)
+        )
+    if valor_max:
+        query = query.filter(
+            (modelo.valor_venda <= valor_max) | 
+            (modelo.valor_aluguel <= valor_max)
+        )
+    if quartos_min:
+        query = query.filter(modelo.quartos >= quartos_min)
+    return query
+
 @imoveis_bp.route('/imoveis', methods=['GET'])
 def listar_imoveis():
     """Lista todos os imóveis com filtros opcionais"""
@@ -17,31 +40,19 @@ def listar_imoveis():
         valor_max = request.args.get('valor_max', type=float)
         quartos_min = request.args.get('quartos_min', type=int)
         
-        # Query base
-        query = Imovel.query.filter_by(ativo=True)
+        incluir_arquivados = request.args.get('incluir_arquivados', 'false').lower() == 'true'
         
-        # Aplicar filtros
-        if tipo:
-            query = query.filter(Imovel.tipo == TipoImovel(tipo))
-        if status:
-            query = query.filter(Imovel.status == StatusImovel(status))
-        if cidade:
-            query = query.filter(Imovel.cidade.ilike(f'%{cidade}%'))
-        if valor_min:
-            query = query.filter(
-                (Imovel.valor_venda >= valor_min) | 
-                (Imovel.valor_aluguel >= valor_min)
-            )
-        if valor_max:
-            query = query.filter(
-                (Imovel.valor_venda <= valor_max) | 
-                (Imovel.valor_aluguel <= valor_max)
-            )
-        if quartos_min:
-            query = query.filter(Imovel.quartos >= quartos_min)
+        # Query base (com incluir_arquivados, imóveis removidos ainda não arquivados também entram)
+        query = Imovel.query if incluir_arquivados else Imovel.query.filter_by(ativo=True)
+        query = _filtrar_imoveis(query, Imovel, tipo, status, cidade, valor_min, valor_max, quartos_min)
         
         imoveis = query.order_by(Imovel.data_cadastro.desc()).all()
         
+        if incluir_arquivados:
+            arquivados = _filtrar_imoveis(ImovelArquivado.query, ImovelArquivado,
+                                          tipo, status, cidade, valor_min, valor_max, quartos_min).all()
+            imoveis = sorted(imoveis + arquivados, key=lambda i: i.data_cadastro or datetime.min, reverse=True)
+        
         return jsonify({
             'success': True,
             'data': [imovel.to_dict() for imovel in imoveis],
@@ -126,7 +137,12 @@ def criar_imovel():
 def obter_imovel(imovel_id):
     """Obtém um imóvel específico"""
     try:
-        imovel = Imovel.query.filter_by(id=imovel_id, ativo=True).first()
+        incluir_arquivados = request.args.get('incluir_arquivados', 'false').lower() == 'true'
+        
+        if incluir_arquivados:
+            imovel = db.session.get(Imovel, imovel_id) or db.session.get(ImovelArquivado, imovel_id)
+        else:
+            imovel = Imovel.query.filter_by(id=imovel_id, ativo=True).first()
         
         if not imovel:
             return jsonify({'success': False, 'error': 'Imóvel não encontrado'}), 404
@@ -252,6 +268,7 @@ def listar_contratos():
     try:
         tipo = request.args.get('tipo')  # 'aluguel' ou 'venda'
         ativo = request.args.get('ativo', type=bool)
+        incluir_arquivados = request.args.get('incluir_arquivados', 'false').lower() == 'true'
         
         query = Contrato.query
         
@@ -262,6 +279,13 @@ def listar_contratos():
         
         contratos = query.order_by(Contrato.data_cadastro.desc()).all()
         
+        # Contratos arquivados estão sempre encerrados
+        if incluir_arquivados and not ativo:
+            query = ContratoArquivado.query
+            if tipo:
+                query = query.filter(ContratoArquivado.tipo_contrato == tipo)
+            contratos = sorted(contratos + query.all(), key=lambda c: c.data_cadastro or datetime.min, reverse=True)
+        
         return jsonify({
             'success': True,
             'data': [contrato.to_dict() for contrato in contratos],
@@ -0,0 +1,212 @@
+from flask import Blueprint, request, jsonify, current_app
+from src.models.user import db
+from src.models.imovel import Imovel, FotoImovel, Contrato
+from src.models.arquivo import ImovelArquivado, FotoImovelArquivada, ContratoArquivado
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+import fcntl
+import threading
+import time
+
+manutencao_bp = Blueprint('manutencao', __name__)
+
+# Cada lote vira um IN (...) com um parâmetro por id; fica abaixo do limite
+# de 999 variáveis das versões mais antigas do SQLite
+LOTE_MAXIMO = 900
+
+def _mover(origem, destino, condicao, data_arquivamento):
+    """Copia as linhas que atendem à condição para o arquivo e as remove da tabela ativa"""
+    colunas = [coluna.name for coluna in origem.columns]
+    selecao = db.select(*origem.columns, db.literal(data_arquivamento, db.DateTime)).where(condicao)
+    resultado = db.session.execute(
+        destino.insert().from_select(colunas + ['data_arquivamento'], selecao)
+    )
+    db.session.execute(origem.delete().where(condicao))
+    return resultado.rowcount
+
+def arquivar_registros(dias, lote=500):
+    """Move contratos encerrados e imóveis removidos há mais de `dias` dias para as tabelas de arquivo.
+
+    Cada lote é gravado em uma transação curta para não segurar o lock de escrita do SQLite.
+    """
+    lote = min(lote, LOTE_MAXIMO)
+    limite = datetime.utcnow() - timedelta(days=dias)
+    agora = datetime.utcnow()
+    totais = {'contratos': 0, 'imoveis': 0, 'fotos': 0}
+
+    # O SQLite reaproveita o id da maior linha removida; manter a linha de maior id
+    # na tabela ativa evita que um novo registro colida com um id já arquivado.
+    maior_contrato = db.session.query(db.func.max(Contrato.id)).scalar_subquery()
+    maior_imovel = db.session.query(db.func.max(Imovel.id)).scalar_subquery()
+    maior_foto = db.session.query(db.func.max(FotoImovel.id)).scalar_subquery()
+
+    # Contratos primeiro, para liberar os imóveis que só tinham contratos encerrados
+    while True:
+        ids = [id for (id,) in db.session.query(Contrato.id).filter(
+            Contrato.ativo == False,
+            db.func.coalesce(Contrato.data_fim, Contrato.data_inicio) < limite.date(),
+            Contrato.id < maior_contrato
+        ).limit(lote)]
+        if not ids:
+            break
+        totais['contratos'] += _mover(Contrato.__table__, ContratoArquivado.__table__, Contrato.id.in_(ids), agora)
+        db.session.commit()
+
+    while True:
+        ids = [id for (id,) in db.session.query(Imovel.id).filter(
+            Imovel.ativo == False,
+            db.func.coalesce(Imovel.data_atualizacao, Imovel.data_cadastro) < limite,
+            Imovel.id < maior_imovel,
+            ~db.exists().where(Contrato.imovel_id == Imovel.id),
+            ~db.exists().where(FotoImovel.imovel_id == Imovel.id, FotoImovel.id >= maior_foto)
+        ).limit(lote)]
+        if not ids:
+            break
+        totais['imoveis'] += _mover(Imovel.__table__, ImovelArquivado.__table__, Imovel.id.in_(ids), agora)
+        totais['fotos'] += _mover(FotoImovel.__table__, FotoImovelArquivada.__table__, FotoImovel.imovel_id.in_(ids), agora)
+        db.session.commit()
+
+    return totais
+
+def _tamanho_banco(conexao):
+    page_count = conexao.exec_driver_sql('PRAGMA page_count').scalar()
+    page_size = conexao.exec_driver_sql('PRAGMA page_size').scalar()
+    return page_count * page_size
+
+def otimizar_banco():
+    """Executa PRAGMA optimize e VACUUM, retornando o tamanho do banco antes e depois"""
+    # VACUUM não roda dentro de transação, então a sessão precisa estar livre
+    db.session.remove()
+    with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conexao:
+        tamanho_antes = _tamanho_banco(conexao)
+        conexao.exec_driver_sql('PRAGMA optimize')
+        conexao.exec_driver_sql('VACUUM')
+        tamanho_depois = _tamanho_banco(conexao)
+
+    return {
+        'tamanho_antes': tamanho_antes,
+        'tamanho_depois': tamanho_depois,
+        'bytes_liberados': tamanho_antes - tamanho_depois
+    }
+
+@contextmanager
+def _lock_manutencao(caminho_lock):
+    """Obtém o lock de manutenção sem bloquear; retorna o arquivo do lock ou None se estiver ocupado.
+
+    O lock é compartilhado entre os workers do gunicorn e guarda o horário da última rodada agendada.
+    """
+    with open(caminho_lock, 'a+') as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            yield None
+            return
+        try:
+            yield lock
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+def _ultima_execucao(lock):
+    lock.seek(0)
+    try:
+        return float(lock.read().strip() or 0)
+    except ValueError:
+        return 0
+
+def _registrar_execucao(lock, instante):
+    lock.seek(0)
+    lock.truncate()
+    lock.write(str(instante))
+    lock.flush()
+
+@manutencao_bp.route('/manutencao/arquivar', methods=['POST'])
+def arquivar():
+    """Move imóveis removidos e contratos encerrados antigos para o arquivo"""
+    # Corpo vazio usa os padrões da configuração; corpo malformado é rejeitado
+    if request.get_data():
+        data = request.get_json(force=True, silent=True)
+        if not isinstance(data, dict):
+            return jsonify({'success': False, 'error': 'O corpo deve ser um objeto JSON válido'}), 400
+    else:
+        data = {}
+
+    try:
+        dias = int(data.get('dias', current_app.config['ARQUIVAMENTO_DIAS']))
+        lote = int(data.get('lote', current_app.config['ARQUIVAMENTO_LOTE']))
+        datetime.utcnow() - timedelta(days=dias)
+    except (TypeError, ValueError, OverflowError) as e:
+        return jsonify({'success': False, 'error': f'Valor inválido: {str(e)}'}), 400
+
+    if dias < 0:
+        return jsonify({'success': False, 'error': 'Dias não pode ser negativo'}), 400
+    if lote <= 0 or lote > LOTE_MAXIMO:
+        return jsonify({'success': False, 'error': f'Lote deve estar entre 1 e {LOTE_MAXIMO}'}), 400
+
+    try:
+        with _lock_manutencao(current_app.config['MANUTENCAO_LOCK']) as lock:
+            if lock is None:
+                return jsonify({'success': False, 'error': 'Manutenção já em andamento'}), 409
+            totais = arquivar_registros(dias, lote)
+
+        return jsonify({
+            'success': True,
+            'data': totais,
+            'message': 'Arquivamento concluído com sucesso'
+        })
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@manutencao_bp.route('/manutencao/otimizar', methods=['POST'])
+def otimizar():
+    """Executa VACUUM e PRAGMA optimize no banco de dados"""
+    try:
+        with _lock_manutencao(current_app.config['MANUTENCAO_LOCK']) as lock:
+            if lock is None:
+                return jsonify({'success': False, 'error': 'Manutenção já em andamento'}), 409
+            tamanho = otimizar_banco()
+
+        return jsonify({
+            'success': True,
+            'data': tamanho,
+            'message': 'Banco de dados otimizado com sucesso'
+        })
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+def agendar_manutencao(app):
+    """Inicia uma thread que arquiva e otimiza o banco a cada MANUTENCAO_INTERVALO_HORAS"""
+    intervalo = app.config.get('MANUTENCAO_INTERVALO_HORAS')
+    if not intervalo:
+        return
+    intervalo_segundos = intervalo * 3600
+
+    def executar_se_vencida():
+        with _lock_manutencao(app.config['MANUTENCAO_LOCK']) as lock:
+            if lock is None:
+                return
+            # O horário da última rodada fica no arquivo de lock, então vale entre
+            # workers do gunicorn e sobrevive a reinícios da máquina
+            inicio = time.time()
+            if inicio - _ultima_execucao(lock) < intervalo_segundos:
+                return
+            _registrar_execucao(lock, inicio)
+            with app.app_context():
+                try:
+                    totais = arquivar_registros(app.config['ARQUIVAMENTO_DIAS'], app.config['ARQUIVAMENTO_LOTE'])
+                    tamanho = otimizar_banco()
+                    app.logger.info('Manutenção concluída: arquivados %s, tamanho %s', totais, tamanho)
+                except Exception:
+                    db.session.rollback()
+                    app.logger.exception('Falha na manutenção agendada do banco')
+
+    def executar():
+        # Verifica com frequência em vez de dormir o intervalo inteiro, para que uma
+        # rodada vencida rode logo após o boot de uma máquina parada pelo Fly.io
+        while True:
+            executar_se_vencida()
+            time.sleep(min(intervalo_segundos, 60))
+
+    threading.Thread(target=executar, name='manutencao-banco', daemon=True).start()